@@ -1,11 +1,14 @@
 from collections.abc import Collection
-from contextlib import AbstractContextManager
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, contextmanager
+import functools
+import io
 import logging
 import os
 from pathlib import Path
 import re
 import time
-from typing import TextIO, BinaryIO
+from typing import IO
 
 try:
     import importlib.resources as pkg_resources
@@ -13,7 +16,6 @@ except ImportError:
     # Try backported to PY<37 `importlib_resources`.
     import importlib_resources as pkg_resources
 
-from .bluetooth_low_energy_interface import BluetoothLowEnergyInterface
 from .serial_interface import SerialInterface
 from .mirobot_status import MirobotStatus, MirobotAngles, MirobotCartesians
 from .exceptions import ExitOnExceptionStreamHandler, MirobotError, MirobotAlarm, MirobotReset, MirobotAmbiguousPort, MirobotStatusError, MirobotResetFileError, MirobotVariableCommandError
@@ -21,10 +23,31 @@ from .exceptions import ExitOnExceptionStreamHandler, MirobotError, MirobotAlarm
 os_is_nt = os.name == 'nt'
 os_is_posix = os.name == 'posix'
 
+# precompiled patterns for the status message (`?`) and variable commands (`$num=value`)
+_STATE_RE = re.compile(r'<([^,]*),Angle\(ABCDXYZ\):([-\.\d,]*),Cartesian coordinate\(XYZ RxRyRz\):([-.\d,]*),Pump PWM:(\d+),Valve PWM:(\d+),Motion_MODE:(\d)>')
+_VAR_CMD_RE = re.compile(r'\$\d+=[\d\.]+')
+
+
+@functools.lru_cache(maxsize=1)
+def _default_reset_file():
+    """ Read the reset commands ("reset.xml") provided by WLkata. The packaged resource never changes, so it is only read once. """
+    return pkg_resources.read_text('mirobot.resources', 'reset.xml')
+
+
+@functools.lru_cache(maxsize=None)
+def _device_arg_names(interface):
+    """ Argument names of a device interface, used to map positional `*device_args` onto keywords. `self` and `mirobot` are skipped, since those are never passed in by the user. """
+    init_code = interface.__init__.__code__
+    return init_code.co_varnames[2:init_code.co_argcount]
+
 
 class BaseMirobot(AbstractContextManager):
     """ A base class for managing and maintaining known Mirobot operations. """
 
+    # the only two instructions each limit setter can send, indexed by the new state
+    _HARD_LIMIT_MSGS = ('$21=0', '$21=1')
+    _SOFT_LIMIT_MSGS = ('$20=0', '$20=1')
+
     def __init__(self, *device_args, debug=False, connection_type='serial', autoconnect=True, autofindport=True, exclusive=True, valve_pwm_values=('65', '40'), pump_pwm_values=('0', '1000'), default_speed=2000, reset_file=None, wait=True, **device_kwargs):
         """
         Initialization of the `BaseMirobot` class.
@@ -46,7 +69,7 @@ class BaseMirobot(AbstractContextManager):
         pump_pwm_values : indexible-collection[str or numeric]
             (Default value = `('0', '1000')`) The 'on' and 'off' values for the pnuematic pump in terms of PWM. Useful if your Mirobot is not calibrated correctly and requires different values to open and close. `BaseMirobot.set_air_pump` will only accept booleans and the values in this parameter, so if you have additional values you'd like to use, pass them in as additional elements in this tuple. Stored in `BaseMirobot.pump_pwm_values`.
         default_speed : int
-            (Default value = `2000`) This speed value will be passed in at each motion command, unless speed is specified as a function argument. Having this explicitly specified fixes phantom `Unknown Feed Rate` errors. Stored in `BaseMirobot.default_speed`.
+            (Default value = `2000`) This speed value will be passed in at each motion command, unless speed is specified as a function argument. Having this explicitly specified fixes phantom `Unknown Feed Rate` errors. If `None`, motion commands only include a speed when given one. Stored in `BaseMirobot.default_speed`.
         reset_file : str or Path or Collection[str] or file-like
             (Default value = `None`) A file-like object, file-path, or str containing reset values for the Mirobot. The default (None) will use the commands in "reset.xml" provided by WLkata to reset the Mirobot. See `BaseMirobot.reset_configuration` for more details.
         wait : bool
@@ -73,9 +96,7 @@ class BaseMirobot(AbstractContextManager):
         """ Object that controls the connection to the Mirobot. Can either be a `mirobot.serial_interface.SerialInterface` or `mirobot.bluetooth_low_energy_interface.BluetoothLowEnergyInterface` class."""
         # Parse inputs into SerialDevice
         if connection_type.lower() in ('serial', 'ser'):
-            serial_device_init_fn = SerialInterface.__init__
-            args_names = serial_device_init_fn.__code__.co_varnames[:serial_device_init_fn.__code__.co_argcount]
-            args_dict = dict(zip(args_names, device_args))
+            args_dict = dict(zip(_device_arg_names(SerialInterface), device_args))
             args_dict.update(device_kwargs)
 
             args_dict['mirobot'] = self
@@ -88,9 +109,10 @@ class BaseMirobot(AbstractContextManager):
             self.default_portname = self.device.default_portname
 
         elif connection_type.lower() in ('bluetooth', 'bt'):
-            bluetooth_device_init_fn = BluetoothLowEnergyInterface.__init__
-            args_names = bluetooth_device_init_fn.__code__.co_varnames[:bluetooth_device_init_fn.__code__.co_argcount]
-            args_dict = dict(zip(args_names, device_args))
+            # only import `bleak` (and start an event loop) for users that actually connect over bluetooth
+            from .bluetooth_low_energy_interface import BluetoothLowEnergyInterface
+
+            args_dict = dict(zip(_device_arg_names(BluetoothLowEnergyInterface), device_args))
             args_dict.update(device_kwargs)
 
             args_dict['mirobot'] = self
@@ -105,7 +127,7 @@ class BaseMirobot(AbstractContextManager):
         self.stream_handler.setFormatter(formatter)
         # self.logger.addHandler(self.stream_handler)
 
-        self.reset_file = pkg_resources.read_text('mirobot.resources', 'reset.xml') if reset_file is None else reset_file
+        self.reset_file = _default_reset_file() if reset_file is None else reset_file
         """ The reset commands to use when resetting the Mirobot. See `BaseMirobot.reset_configuration` for usage and details. """
         self._debug = debug
         """ Boolean that determines if every input and output is to be printed to the screen. """
@@ -114,14 +136,19 @@ class BaseMirobot(AbstractContextManager):
         """ Collection of values to use for PWM values for valve module. First value is the 'On' position while the second is the 'Off' position. Only these values may be permitted. """
         self.pump_pwm_values = tuple(str(n) for n in pump_pwm_values)
         """ Collection of values to use for PWM values for pnuematic pump module. First value is the 'On' position while the second is the 'Off' position. Only these values may be permitted. """
-        self.default_speed = default_speed
-        """ The default speed to use when issuing commands that involve the speed parameter. """
+        self.default_speed = None if default_speed is None else int(default_speed)
+        """ The default speed to use when issuing commands that involve the speed parameter. If `None`, no speed is sent unless one is given to the command. """
         self.wait = wait
         """ Boolean that determines if every command should wait for a status message to return before unblocking function evaluation. Can be overridden on an individual basis by providing the `wait=` parameter to all command functions. """
 
         self.status = MirobotStatus()
         """ Dataclass that holds tracks Mirobot's coordinates and pwm values among other quantities. See `mirobot.mirobot_status.MirobotStatus` for more details."""
 
+        self._pipeline = None
+        """ List of instructions queued up by `BaseMirobot.pipeline`, or `None` if no pipeline is active. """
+        self._status_executor = None
+        """ Single worker thread that runs `BaseMirobot.update_status_async`, created on first use. """
+
         # do this at the very end, after everything is setup
         if autoconnect:
             self.connect()
@@ -142,6 +169,10 @@ class BaseMirobot(AbstractContextManager):
         self.device.connect()
 
     def disconnect(self):
+        if getattr(self, '_status_executor', None) is not None:
+            self._status_executor.shutdown(wait=True)
+            self._status_executor = None
+
         if getattr(self, 'device', None) is not None:
             self.device.disconnect()
 
@@ -149,6 +180,11 @@ class BaseMirobot(AbstractContextManager):
     def is_connected(self):
         return self.device.is_connected
 
+    @staticmethod
+    def rescan_ports():
+        """ Forget the cached list of serial ports, so that the next instance created with `autofindport` also sees Mirobots plugged in after the last port search. See `mirobot.serial_interface.SerialInterface.rescan_ports`. """
+        SerialInterface.rescan_ports()
+
     @property
     def debug(self):
         """ Return the `debug` property of `BaseMirobot` """
@@ -195,18 +231,131 @@ class BaseMirobot(AbstractContextManager):
             If `wait` is `True`, then return a list of strings which contains message output.
             If `wait` is `False`, then return whether sending the message succeeded.
         """
+        msg = self._prepare_msg(msg, var_command=var_command)
+
+        if _VAR_CMD_RE.fullmatch(msg):
+            return self._send_setting(msg, disable_debug=disable_debug, wait=wait)
+
+        return self._send_str(msg, disable_debug=disable_debug, wait=wait, wait_idle=wait_idle)
+
+    def _prepare_msg(self, msg, var_command=False):
+        """
+        Coerce a user-provided message into an instruction that can be sent to the Mirobot.
+
+        Parameters
+        ----------
+        msg : str or bytes
+             A message or instruction to send to the Mirobot.
+        var_command : bool
+            (Default value = `False`) Whether `msg` is a variable command (of form `$num=value`). Will throw an error if does not validate correctly.
+
+        Returns
+        -------
+        msg : str
+            The instruction, decoded and stripped of any surrounding whitespace.
+        """
+        # convert to str from bytes
+        if isinstance(msg, bytes):
+            msg = str(msg, 'utf-8')
+
+        # remove any newlines
+        msg = msg.strip()
+
+        # check if this is supposed to be a variable command and fail if not
+        if var_command and not _VAR_CMD_RE.fullmatch(msg):
+            self.logger.exception(MirobotVariableCommandError("Message is not a variable command: " + msg))
+
+        return msg
+
+    def send_batch(self, msgs, disable_debug=False, wait_idle=True):
+        """
+        Send several messages to the Mirobot at once. Over a serial connection, the messages are streamed into the Mirobot's receive buffer instead of waiting for each one to be acknowledged before sending the next, which removes the round-trip latency between consecutive commands.
+        Do not use this for variable commands (`$num=value`): the Mirobot writes those to eeprom, during which it drops incoming bytes.
+
+        Parameters
+        ----------
+        msgs : Iterable[str or bytes]
+             The messages or instructions to send to the Mirobot, in order.
+        disable_debug : bool
+            (Default value = `False`) Whether to override the class debug setting.
+        wait_idle : bool
+            (Default value = `True`) Whether to wait for Mirobot to be idle after the last message before returning.
+
+        Returns
+        -------
+        msg : List[List[str]]
+            The message output of every message, in the order they were sent.
+        """
         if self.is_connected:
-            # convert to str from bytes
-            if isinstance(msg, bytes):
-                msg = str(msg, 'utf-8')
+            return self.device.send_batch([self._prepare_msg(msg) for msg in msgs],
+                                          disable_debug=disable_debug,
+                                          terminator=os.linesep,
+                                          wait_idle=wait_idle)
+
+        else:
+            raise Exception('Mirobot is not Connected!')
+
+    @contextmanager
+    def pipeline(self):
+        """
+        Context manager that queues up the instructions of all commands issued inside of it, and sends them with `BaseMirobot.send_batch` on leaving the block. Status queries and rover commands are still sent right away.
+        Commands issued inside the block return `True` instead of their output, since nothing has been sent yet. If the block raises an exception, the queued instructions are discarded. Nested blocks join the outermost one, which sends everything in the order it was issued.
+
+        Example:
+
+        ```
+        with mirobot.pipeline():
+            mirobot.go_to_axis(0, 0, 0, 0, 0, 0)
+            mirobot.go_to_cartesian_lin(200, 0, 230)
+        ```
+
+        Returns
+        -------
+        mirobot : `BaseMirobot`
+            This instance.
+        """
+        if self._pipeline is not None:
+            # the outermost block sends the queue, so the commands keep their order
+            yield self
+            return
+
+        queued = self._pipeline = []
+        try:
+            yield self
+        finally:
+            self._pipeline = None
 
-            # remove any newlines
-            msg = msg.strip()
+        if queued:
+            self.send_batch(queued, wait_idle=True)
 
-            # check if this is supposed to be a variable command and fail if not
-            if var_command and not re.fullmatch(r'\$\d+=[\d\.]+', msg):
-                self.logger.exception(MirobotVariableCommandError("Message is not a variable command: " + msg))
+    def _send_str(self, msg, disable_debug=False, wait=None, wait_idle=False, queue=True):
+        """
+        Send an instruction to the Mirobot without any coercion or validation. Used by the built-in commands, whose instructions are always well-formed `str`s. User input should go through `BaseMirobot.send_msg` instead.
+
+        Parameters
+        ----------
+        msg : str
+             An instruction to send to the Mirobot. Must not contain any newlines.
+        disable_debug : bool
+            (Default value = `False`) Whether to override the class debug setting. Used primarily by ` BaseMirobot.device.wait_until_idle`.
+        wait : bool
+            (Default value = `None`) Whether to wait for output to end and to return that output. If `None`, use class default `BaseMirobot.wait` instead.
+        wait_idle : bool
+            (Default value = `False`) Whether to wait for Mirobot to be idle before returning.
+        queue : bool
+            (Default value = `True`) Whether to queue the instruction instead of sending it when inside of a `BaseMirobot.pipeline` block.
+
+        Returns
+        -------
+        msg : List[str] or bool
+            If `wait` is `True`, then return a list of strings which contains message output.
+            If `wait` is `False`, then return whether sending the message succeeded.
+        """
+        if queue and self._pipeline is not None:
+            self._pipeline.append(msg)
+            return True
 
+        if self.is_connected:
             # actually send the message
             output = self.device.send(msg,
                                       disable_debug=disable_debug,
@@ -219,6 +368,33 @@ class BaseMirobot(AbstractContextManager):
         else:
             raise Exception('Mirobot is not Connected!')
 
+    def _send_setting(self, msg, disable_debug=False, wait=None):
+        """
+        Send a variable command (`$num=value`) on its own. The Mirobot stops receiving while it writes the setting to eeprom, so settings are never streamed together with other instructions. Inside of a `BaseMirobot.pipeline` block, the instructions queued so far are sent first and the setting goes out once the Mirobot is idle.
+
+        Parameters
+        ----------
+        msg : str
+             A validated variable command.
+        disable_debug : bool
+            (Default value = `False`) Whether to override the class debug setting.
+        wait : bool
+            (Default value = `None`) Whether to wait for output to end and to return that output. If `None`, use class default `BaseMirobot.wait` instead.
+
+        Returns
+        -------
+        msg : List[str] or bool
+            If `wait` is `True`, then return a list of strings which contains message output.
+            If `wait` is `False`, then return whether sending the message succeeded.
+        """
+        if self._pipeline:
+            queued = self._pipeline[:]
+            # empty the queue in place, since the outermost `pipeline` block holds on to it
+            del self._pipeline[:]
+            self.send_batch(queued, disable_debug=disable_debug, wait_idle=True)
+
+        return self._send_str(msg, disable_debug=disable_debug, wait=wait, queue=False)
+
     def get_status(self, disable_debug=False):
         """
         Get the status of the Mirobot. (Command: `?`)
@@ -236,7 +412,8 @@ class BaseMirobot(AbstractContextManager):
         """
         instruction = '?'
         # we don't want to wait for idle when checking status-- this leads to unbroken recursion!!
-        return self.send_msg(instruction, disable_debug=disable_debug, wait=True, wait_idle=False)
+        # the status is needed right away, so never queue it in a pipeline
+        return self._send_str(instruction, disable_debug=disable_debug, wait=True, wait_idle=False, queue=False)
 
     def update_status(self, disable_debug=False):
         """
@@ -252,6 +429,26 @@ class BaseMirobot(AbstractContextManager):
         status_msg = self.get_status(disable_debug=disable_debug)[0]
         self._set_status(self._parse_status(status_msg))
 
+    def update_status_async(self, disable_debug=True):
+        """
+        Update the status of the Mirobot on a background thread, so that the status round trip overlaps with whatever the caller does in the meantime (for example, a move sent with `wait=False`).
+        Both device interfaces hold a lock for each exchange and only read a cached flag to check the connection, so the status query never interleaves with another command's reply. Note that the Mirobot answers `?` with an `ok` like any other command, so it cannot be slipped in as a grbl realtime command while another command is still awaiting its `ok`.
+
+        Parameters
+        ----------
+        disable_debug : bool
+            (Default value = `True`) Whether to override the class debug setting.
+
+        Returns
+        -------
+        future : `concurrent.futures.Future`
+            Future that completes once `BaseMirobot.status` has been updated.
+        """
+        if self._status_executor is None:
+            self._status_executor = ThreadPoolExecutor(max_workers=1)
+
+        return self._status_executor.submit(self.update_status, disable_debug=disable_debug)
+
     def _set_status(self, status):
         """
         Set the status object given as the instance's new status.
@@ -279,26 +476,20 @@ class BaseMirobot(AbstractContextManager):
             A new `mirobot.mirobot_status.MirobotStatus` object containing the new values obtained from `msg`.
         """
 
-        return_status = MirobotStatus()
-
-        state_regex = r'<([^,]*),Angle\(ABCDXYZ\):([-\.\d,]*),Cartesian coordinate\(XYZ RxRyRz\):([-.\d,]*),Pump PWM:(\d+),Valve PWM:(\d+),Motion_MODE:(\d)>'
-
-        regex_match = re.fullmatch(state_regex, msg)
-
+        regex_match = _STATE_RE.fullmatch(msg)
         if regex_match:
             try:
                 state, angles, cartesians, pump_pwm, valve_pwm, motion_mode = regex_match.groups()
 
-                return_angles = MirobotAngles(**dict(zip('xyzdabc', map(float, angles.split(',')))))
+                # angles are reported in the order of x, y, z, d, a, b, c
+                x, y, z, d, a, b, c = map(float, angles.split(','))
 
-                return_cartesians = MirobotCartesians(*map(float, cartesians.split(',')))
-
-                return_status = MirobotStatus(state,
-                                              return_angles,
-                                              return_cartesians,
-                                              int(pump_pwm),
-                                              int(valve_pwm),
-                                              bool(motion_mode))
+                return_status = MirobotStatus(state=state,
+                                              angle=MirobotAngles(a, b, c, x, y, z, d),
+                                              cartesian=MirobotCartesians(*map(float, cartesians.split(','))),
+                                              pump_pwm=int(pump_pwm),
+                                              valve_pwm=int(valve_pwm),
+                                              motion_mode=bool(int(motion_mode)))
 
             except Exception as exception:
                 self.logger.exception(MirobotStatusError(f"Could not parse status message \"{msg}\""),
@@ -325,7 +516,7 @@ class BaseMirobot(AbstractContextManager):
             If `wait` is `False`, then return whether sending the message succeeded.
         """
         msg = '$HH'
-        return self.send_msg(msg, wait=wait, wait_idle=True)
+        return self._send_str(msg, wait=wait, wait_idle=True)
 
     def home_simultaneous(self, wait=None):
         """
@@ -343,7 +534,7 @@ class BaseMirobot(AbstractContextManager):
             If `wait` is `False`, then return whether sending the message succeeded.
         """
         msg = '$H'
-        return self.send_msg(msg, wait=wait, wait_idle=True)
+        return self._send_str(msg, wait=wait, wait_idle=True)
 
     def set_hard_limit(self, state, wait=None):
         """
@@ -362,8 +553,12 @@ class BaseMirobot(AbstractContextManager):
             If `wait` is `True`, then return a list of strings which contains message output.
             If `wait` is `False`, then return whether sending the message succeeded.
         """
-        msg = f'$21={int(state)}'
-        return self.send_msg(msg, var_command=True, wait=wait)
+        state = int(state)
+        if state not in (0, 1):
+            self.logger.exception(ValueError(f'state must be 0 or 1. Was given {state}.'))
+
+        msg = self._HARD_LIMIT_MSGS[state]
+        return self._send_setting(msg, wait=wait)
 
     # set the soft limit state
     def set_soft_limit(self, state, wait=None):
@@ -383,8 +578,12 @@ class BaseMirobot(AbstractContextManager):
              If `wait` is `True`, then return a list of strings which contains message output.
              If `wait` is `False`, then return whether sending the message succeeded.
         """
-        msg = f'$20={int(state)}'
-        return self.send_msg(msg, var_command=True, wait=wait)
+        state = int(state)
+        if state not in (0, 1):
+            self.logger.exception(ValueError(f'state must be 0 or 1. Was given {state}.'))
+
+        msg = self._SOFT_LIMIT_MSGS[state]
+        return self._send_setting(msg, wait=wait)
 
     def unlock_shaft(self, wait=None):
         """
@@ -402,32 +601,47 @@ class BaseMirobot(AbstractContextManager):
             If `wait` is `False`, then return whether sending the message succeeded.
         """
         msg = 'M50'
-        return self.send_msg(msg, wait=wait)
+        return self._send_str(msg, wait=wait)
 
     @staticmethod
-    def _generate_args_string(instruction, pairings):
+    def _format_move(instruction, x=None, y=None, z=None, a=None, b=None, c=None, d=None, speed=None):
         """
-        A helper methods to generate argument strings for the various movement instructions.
+        A helper method to generate the instruction string for the various movement instructions.
 
         Parameters
         ----------
         instruction : str
             The command to include at the beginning of the string.
-        pairings : dict[str:Any]
-            A dictionary containing the pairings of argument name to argument value.
-            If a value is `None`, it and its argument name is not included in the result.
+        x, y, z, a, b, c, d : float
+            (Default value = `None`) The axis values, emitted as `X`, `Y`, `Z`, `A`, `B`, `C` and `D` arguments.
+        speed : int
+            (Default value = `None`) The speed, emitted as the `F` argument.
+            Any value that is `None` is not included in the result.
 
         Returns
         -------
-        msg : List[str] or bool
-            If `wait` is `True`, then return a list of strings which contains message output.
-            If `wait` is `False`, then return whether sending the message succeeded.
-message
+        msg : str
             A string containing the base command followed by the correctly formatted arguments.
         """
-        args = [f'{arg_key}{value}' for arg_key, value in pairings.items() if value is not None]
-
-        return ' '.join([instruction] + args)
+        parts = [instruction]
+        if x is not None:
+            parts.append(f'X{x}')
+        if y is not None:
+            parts.append(f'Y{y}')
+        if z is not None:
+            parts.append(f'Z{z}')
+        if a is not None:
+            parts.append(f'A{a}')
+        if b is not None:
+            parts.append(f'B{b}')
+        if c is not None:
+            parts.append(f'C{c}')
+        if d is not None:
+            parts.append(f'D{d}')
+        if speed is not None:
+            parts.append(f'F{speed}')
+
+        return ' '.join(parts)
 
     def go_to_axis(self, x=None, y=None, z=None, a=None, b=None, c=None, d=None, speed=None, wait=None):
         """
@@ -450,7 +664,7 @@ message
         d : float
             (Default value = `None`) Location of slide rail module.
         speed : int
-            (Default value = `None`) The speed in which the Mirobot moves during this operation. (mm/s)
+            (Default value = `None`) The speed in which the Mirobot moves during this operation. (mm/s) If `None`, use class default `BaseMirobot.default_speed` instead.
         wait : bool
             (Default value = `None`) Whether to wait for output to return from the Mirobot before returning from the function. This value determines if the function will block until the operation recieves feedback. If `None`, use class default `BaseMirobot.wait` instead.
 
@@ -461,15 +675,11 @@ message
             If `wait` is `False`, then return whether sending the message succeeded.
         """
         instruction = 'M21 G90'  # X{x} Y{y} Z{z} A{a} B{b} C{c} F{speed}
-        if not speed:
-            speed = self.default_speed
-        if speed:
-            speed = int(speed)
+        speed = self.default_speed if speed is None else int(speed)
 
-        pairings = {'X': x, 'Y': y, 'Z': z, 'A': a, 'B': b, 'C': c, 'D': d, 'F': speed}
-        msg = self._generate_args_string(instruction, pairings)
+        msg = self._format_move(instruction, x, y, z, a, b, c, d, speed)
 
-        return self.send_msg(msg, wait=wait, wait_idle=True)
+        return self._send_str(msg, wait=wait, wait_idle=True)
 
     def increment_axis(self, x=None, y=None, z=None, a=None, b=None, c=None, d=None, speed=None, wait=None):
         """
@@ -492,7 +702,7 @@ message
         d : float
             (Default value = `None`) Location of slide rail module.
         speed : int
-            (Default value = `None`) The speed in which the Mirobot moves during this operation. (mm/s)
+            (Default value = `None`) The speed in which the Mirobot moves during this operation. (mm/s) If `None`, use class default `BaseMirobot.default_speed` instead.
         wait : bool
             (Default value = `None`) Whether to wait for output to return from the Mirobot before returning from the function. This value determines if the function will block until the operation recieves feedback. If `None`, use class default `BaseMirobot.wait` instead.
 
@@ -504,15 +714,11 @@ message
         """
         instruction = 'M21 G91'  # X{x} Y{y} Z{z} A{a} B{b} C{c} F{speed}
 
-        if not speed:
-            speed = self.default_speed
-        if speed:
-            speed = int(speed)
+        speed = self.default_speed if speed is None else int(speed)
 
-        pairings = {'X': x, 'Y': y, 'Z': z, 'A': a, 'B': b, 'C': c, 'D': d, 'F': speed}
-        msg = self._generate_args_string(instruction, pairings)
+        msg = self._format_move(instruction, x, y, z, a, b, c, d, speed)
 
-        return self.send_msg(msg, wait=wait, wait_idle=True)
+        return self._send_str(msg, wait=wait, wait_idle=True)
 
     def go_to_cartesian_ptp(self, x=None, y=None, z=None, a=None, b=None, c=None, speed=None, wait=None):
         """
@@ -533,7 +739,7 @@ message
         c : float
             (Default value = `None`) Orientation angle: Yaw angle
         speed : int
-            (Default value = `None`) The speed in which the Mirobot moves during this operation. (mm/s)
+            (Default value = `None`) The speed in which the Mirobot moves during this operation. (mm/s) If `None`, use class default `BaseMirobot.default_speed` instead.
         wait : bool
             (Default value = `None`) Whether to wait for output to return from the Mirobot before returning from the function. This value determines if the function will block until the operation recieves feedback. If `None`, use class default `BaseMirobot.wait` instead.
 
@@ -545,15 +751,11 @@ message
         """
         instruction = 'M20 G90 G0'  # X{x} Y{y} Z{z} A{a} B{b} C{c} F{speed}
 
-        if not speed:
-            speed = self.default_speed
-        if speed:
-            speed = int(speed)
+        speed = self.default_speed if speed is None else int(speed)
 
-        pairings = {'X': x, 'Y': y, 'Z': z, 'A': a, 'B': b, 'C': c, 'F': speed}
-        msg = self._generate_args_string(instruction, pairings)
+        msg = self._format_move(instruction, x, y, z, a, b, c, speed=speed)
 
-        return self.send_msg(msg, wait=wait, wait_idle=True)
+        return self._send_str(msg, wait=wait, wait_idle=True)
 
     def go_to_cartesian_lin(self, x=None, y=None, z=None, a=None, b=None, c=None, speed=None, wait=None):
         """
@@ -574,7 +776,7 @@ message
         c : float
             (Default value = `None`) Orientation angle: Yaw angle
         speed : int
-            (Default value = `None`) The speed in which the Mirobot moves during this operation. (mm/s)
+            (Default value = `None`) The speed in which the Mirobot moves during this operation. (mm/s) If `None`, use class default `BaseMirobot.default_speed` instead.
         wait : bool
             (Default value = `None`) Whether to wait for output to return from the Mirobot before returning from the function. This value determines if the function will block until the operation recieves feedback. If `None`, use class default `BaseMirobot.wait` instead.
 
@@ -586,15 +788,11 @@ message
         """
         instruction = 'M20 G90 G1'  # X{x} Y{y} Z{z} A{a} B{b} C{c} F{speed}
 
-        if not speed:
-            speed = self.default_speed
-        if speed:
-            speed = int(speed)
+        speed = self.default_speed if speed is None else int(speed)
 
-        pairings = {'X': x, 'Y': y, 'Z': z, 'A': a, 'B': b, 'C': c, 'F': speed}
-        msg = self._generate_args_string(instruction, pairings)
+        msg = self._format_move(instruction, x, y, z, a, b, c, speed=speed)
 
-        return self.send_msg(msg, wait=wait, wait_idle=True)
+        return self._send_str(msg, wait=wait, wait_idle=True)
 
     def increment_cartesian_ptp(self, x=None, y=None, z=None, a=None, b=None, c=None, speed=None, wait=None):
         """
@@ -615,7 +813,7 @@ message
         c : float
             (Default value = `None`) Orientation angle: Yaw angle
         speed : int
-            (Default value = `None`) The speed in which the Mirobot moves during this operation. (mm/s)
+            (Default value = `None`) The speed in which the Mirobot moves during this operation. (mm/s) If `None`, use class default `BaseMirobot.default_speed` instead.
         wait : bool
             (Default value = `None`) Whether to wait for output to return from the Mirobot before returning from the function. This value determines if the function will block until the operation recieves feedback. If `None`, use class default `BaseMirobot.wait` instead.
 
@@ -627,15 +825,11 @@ message
         """
         instruction = 'M20 G91 G0'  # X{x} Y{y} Z{z} A{a} B{b} C{c} F{speed}
 
-        if not speed:
-            speed = self.default_speed
-        if speed:
-            speed = int(speed)
+        speed = self.default_speed if speed is None else int(speed)
 
-        pairings = {'X': x, 'Y': y, 'Z': z, 'A': a, 'B': b, 'C': c, 'F': speed}
-        msg = self._generate_args_string(instruction, pairings)
+        msg = self._format_move(instruction, x, y, z, a, b, c, speed=speed)
 
-        return self.send_msg(msg, wait=wait, wait_idle=True)
+        return self._send_str(msg, wait=wait, wait_idle=True)
 
     def increment_cartesian_lin(self, x=None, y=None, z=None, a=None, b=None, c=None, speed=None, wait=None):
         """
@@ -656,7 +850,7 @@ message
         c : float
             (Default value = `None`) Orientation angle: Yaw angle
         speed : int
-            (Default value = `None`) The speed in which the Mirobot moves during this operation. (mm/s)
+            (Default value = `None`) The speed in which the Mirobot moves during this operation. (mm/s) If `None`, use class default `BaseMirobot.default_speed` instead.
         wait : bool
             (Default value = `None`) Whether to wait for output to return from the Mirobot before returning from the function. This value determines if the function will block until the operation recieves feedback. If `None`, use class default `BaseMirobot.wait` instead.
 
@@ -668,15 +862,37 @@ message
         """
         instruction = 'M20 G91 G1'  # X{x} Y{y} Z{z} A{a} B{b} C{c} F{speed}
 
-        if not speed:
-            speed = self.default_speed
-        if speed:
-            speed = int(speed)
+        speed = self.default_speed if speed is None else int(speed)
+
+        msg = self._format_move(instruction, x, y, z, a, b, c, speed=speed)
+
+        return self._send_str(msg, wait=wait, wait_idle=True)
 
-        pairings = {'X': x, 'Y': y, 'Z': z, 'A': a, 'B': b, 'C': c, 'F': speed}
-        msg = self._generate_args_string(instruction, pairings)
+    def _pwm_msg(self, pwm, pwm_values, instruction):
+        """
+        Build the instruction that sets a PWM module to the given value.
 
-        return self.send_msg(msg, wait=wait, wait_idle=True)
+        Parameters
+        ----------
+        pwm : int or str or bool
+            The pulse width modulation frequency to use. `True` and `False` select the module's 'On' and 'Off' values.
+        pwm_values : Tuple[str]
+            The values permitted for the module, 'On' value first.
+        instruction : str
+            The command that sets the module, followed by the value.
+
+        Returns
+        -------
+        msg : str
+            The instruction to send.
+        """
+        if isinstance(pwm, bool):
+            pwm = pwm_values[not pwm]
+
+        if str(pwm) not in pwm_values:
+            self.logger.exception(ValueError(f'pwm must be one of these values: {pwm_values}. Was given {pwm}.'))
+
+        return f'{instruction}{pwm}'
 
     # set the pwm of the air pump
     def set_air_pump(self, pwm, wait=None):
@@ -697,14 +913,8 @@ message
             If `wait` is `False`, then return whether sending the message succeeded.
         """
 
-        if isinstance(pwm, bool):
-            pwm = self.pump_pwm_values[not pwm]
-
-        if str(pwm) not in self.pump_pwm_values:
-            self.logger.exception(ValueError(f'pwm must be one of these values: {self.pump_pwm_values}. Was given {pwm}.'))
-
-        msg = f'M3S{pwm}'
-        return self.send_msg(msg, wait=wait, wait_idle=True)
+        msg = self._pwm_msg(pwm, self.pump_pwm_values, 'M3S')
+        return self._send_str(msg, wait=wait, wait_idle=True)
 
     def set_valve(self, pwm, wait=None):
         """
@@ -724,14 +934,8 @@ message
             If `wait` is `False`, then return whether sending the message succeeded.
         """
 
-        if isinstance(pwm, bool):
-            pwm = self.valve_pwm_values[not pwm]
-
-        if str(pwm) not in self.valve_pwm_values:
-            self.logger.exception(ValueError(f'pwm must be one of these values: {self.valve_pwm_values}. Was given {pwm}.'))
-
-        msg = f'M4E{pwm}'
-        return self.send_msg(msg, wait=wait, wait_idle=True)
+        msg = self._pwm_msg(pwm, self.valve_pwm_values, 'M4E')
+        return self._send_str(msg, wait=wait, wait_idle=True)
 
     def start_calibration(self, wait=None):
         """
@@ -749,7 +953,7 @@ message
              If `wait` is `False`, then return whether sending the message succeeded.
         """
         instruction = 'M40'
-        return self.send_msg(instruction, wait=wait)
+        return self._send_str(instruction, wait=wait)
 
     def finish_calibration(self, wait=None):
         """
@@ -767,9 +971,9 @@ message
              If `wait` is `False`, then return whether sending the message succeeded.
         """
         instruction = 'M41'
-        return self.send_msg(instruction, wait=wait)
+        return self._send_str(instruction, wait=wait)
 
-    def reset_configuration(self, reset_file=None, wait=None):
+    def reset_configuration(self, reset_file=None, wait=None, collect_output=True):
         """
         Reset the Mirobot by resetting all eeprom variables to their factory settings. If provided an explicit `reset_file` on invocation, it will execute reset commands given in by `reset_file` instead of `self.reset_file`.
 
@@ -779,41 +983,61 @@ message
             (Default value = `True`) A file-like object, Collection, or string containing reset values for the Mirobot. If given a string with newlines, it will split on those newlines and pass those in as "variable reset commands". Passing in the default value (None) will use the commands in "reset.xml" provided by WLkata to reset the Mirobot. If passed in a string without newlines, `BaseMirobot.reset_configuration` will try to open the file specified by the string and read from it. A `Path` object will be processed similarly. With a Collection (list-like) object, `BaseMirobot.reset_configuration` will use each element as the message body for `BaseMirobot.send_msg`. One can also pass in file-like objects as well (like `open('path')`).
         wait : bool
             (Default value = `None`) Whether to wait for output to return from the Mirobot before returning from the function. This value determines if the function will block until the operation recieves feedback. If `None`, use class default `BaseMirobot.wait` instead.
+        collect_output : bool
+            (Default value = `True`) Whether to collect and return the output of each reset command. Turn this off if the output is not needed.
 
         Returns
         -------
-        msg : List[str] or bool
-             If `wait` is `True`, then return a list of strings which contains message output.
-             If `wait` is `False`, then return whether sending the message succeeded.
+        msg : Dict[str, List[str] or bool] or None
+             If `collect_output` is `True`, then return a dictionary that maps each reset command to its output.
+             If `wait` is `True`, each output is a list of strings which contains message output.
+             If `wait` is `False`, each output is whether sending the message succeeded.
+             If `collect_output` is `False`, then return `None`.
         """
 
         output = {}
 
         def send_each_line(file_lines):
             nonlocal output
-            for line in file_lines:
-                output[line] = self.send_msg(line, var_command=True, wait=wait)
+            # collected once (iterating files directly instead of `readlines()` copying them first),
+            # so everything can be validated up front and a bad line can't leave the Mirobot half-reset
+            file_lines = list(file_lines)
+            msgs = [self._prepare_msg(line, var_command=True) for line in file_lines]
+
+            # never stream settings: the controller stops receiving while it writes to eeprom
+            for line, msg in zip(file_lines, msgs):
+                result = self._send_setting(msg, wait=wait)
+                if collect_output:
+                    output[line] = result
 
         reset_file = reset_file if reset_file else self.reset_file
 
-        if isinstance(reset_file, str) and '\n' in reset_file or \
-           isinstance(reset_file, bytes) and b'\n' in reset_file:
+        if isinstance(reset_file, bytes):
+            reset_file = str(reset_file, 'utf-8')
+
+        if isinstance(reset_file, str) and '\n' in reset_file:
             # if we find that we have a string and it contains new lines,
             send_each_line(reset_file.splitlines())
 
         elif isinstance(reset_file, (str, Path)):
-            if not os.path.exists(reset_file):
-                self.logger.exception(MirobotResetFileError("Reset file not found or reachable: {reset_file}"))
-            with open(reset_file, 'r') as f:
-                send_each_line(f.readlines())
+            try:
+                f = open(reset_file, 'r')
+            except OSError:
+                self.logger.exception(MirobotResetFileError(f"Reset file not found or reachable: {reset_file}"))
+                raise
 
-        elif isinstance(reset_file, Collection) and not isinstance(reset_file, str):
+            with f:
+                send_each_line(f)
+
+        # file objects returned by `open` are not `typing.IO` subclasses, so check for `io.IOBase` too.
+        # this has to come first, since some file-likes also count as a `Collection`
+        elif isinstance(reset_file, (io.IOBase, IO)):
             send_each_line(reset_file)
 
-        elif isinstance(reset_file, (TextIO, BinaryIO)):
-            send_each_line(reset_file.readlines())
+        elif isinstance(reset_file, Collection):
+            send_each_line(reset_file)
 
         else:
             self.logger.exception(MirobotResetFileError(f"Unable to handle reset file of type: {type(reset_file)}"))
 
-        return output
+        return output if collect_output else None
@@ -7,22 +7,17 @@ class BaseRover:
         self._mirobot = mirobot
 
     def time_decorator(fn):
+        # resolve the argument positions once at decoration time (skipping `self`)
+        args_names = fn.__code__.co_varnames[1:fn.__code__.co_argcount]
+        time_index = args_names.index('time')
+        wait_index = args_names.index('wait')
+
         @functools.wraps(fn)
         def time_wrapper(self, *args, **kwargs):
-            args_names = fn.__code__.co_varnames[:fn.__code__.co_argcount]
-            args_dict = dict(zip(args_names, args))
-
-            def get_arg(arg_name, default=None):
-                if arg_name in args_dict:
-                    return args_dict.get(arg_name)
-                elif arg_name in kwargs:
-                    return kwargs.get(arg_name)
-                else:
-                    return default
-
-            time = get_arg('time', 0)
-            wait = get_arg('wait', True)
+            time = args[time_index] if len(args) > time_index else kwargs.get('time', 0)
+            wait = args[wait_index] if len(args) > wait_index else kwargs.get('wait', True)
 
+            # rover commands bypass `BaseMirobot.pipeline`, so the timed stop below follows an actual start
             output = fn(self, *args, **kwargs)
 
             if time:
@@ -36,53 +31,53 @@ class BaseRover:
     @time_decorator
     def move_upper_left(self, time=0, wait=True):
         instruction = "W7"
-        return self._mirobot.send_msg(instruction, wait=wait, terminator='\r\n')
+        return self._mirobot._send_str(instruction, wait=wait, queue=False)
 
     @time_decorator
     def move_upper_right(self, time=0, wait=True):
         instruction = "W9"
-        return self._mirobot.send_msg(instruction, wait=wait, terminator='\r\n')
+        return self._mirobot._send_str(instruction, wait=wait, queue=False)
 
     @time_decorator
     def move_bottom_left(self, time=0, wait=True):
         instruction = "W1"
-        return self._mirobot.send_msg(instruction, wait=wait, terminator='\r\n')
+        return self._mirobot._send_str(instruction, wait=wait, queue=False)
 
     @time_decorator
     def move_bottom_right(self, time=0, wait=True):
         instruction = "W3"
-        return self._mirobot.send_msg(instruction, wait=wait, terminator='\r\n')
+        return self._mirobot._send_str(instruction, wait=wait, queue=False)
 
     @time_decorator
     def move_left(self, time=0, wait=True):
         instruction = "W4"
-        return self._mirobot.send_msg(instruction, wait=wait, terminator='\r\n')
+        return self._mirobot._send_str(instruction, wait=wait, queue=False)
 
     @time_decorator
     def move_right(self, time=0, wait=True):
         instruction = "W6"
-        return self._mirobot.send_msg(instruction, wait=wait, terminator='\r\n')
+        return self._mirobot._send_str(instruction, wait=wait, queue=False)
 
     @time_decorator
     def rotate_left(self, time=0, wait=True):
         instruction = "W10"
-        return self._mirobot.send_msg(instruction, wait=wait, terminator='\r\n')
+        return self._mirobot._send_str(instruction, wait=wait, queue=False)
 
     @time_decorator
     def rotate_right(self, time=0, wait=True):
         instruction = "W11"
-        return self._mirobot.send_msg(instruction, wait=wait, terminator='\r\n')
+        return self._mirobot._send_str(instruction, wait=wait, queue=False)
 
     @time_decorator
     def move_forward(self, time=0, wait=True):
         instruction = "W8"
-        return self._mirobot.send_msg(instruction, wait=wait, terminator='\r\n')
+        return self._mirobot._send_str(instruction, wait=wait, queue=False)
 
     @time_decorator
     def move_backward(self, time=0, wait=True):
         instruction = "W2"
-        return self._mirobot.send_msg(instruction, wait=wait, terminator='\r\n')
+        return self._mirobot._send_str(instruction, wait=wait, queue=False)
 
     def stop(self, wait=True):
         instruction = "W0"
-        return self._mirobot.send_msg(instruction, wait=wait, terminator='\r\n')
+        return self._mirobot._send_str(instruction, wait=wait, queue=False)
@@ -1,6 +1,7 @@
 import asyncio
 import os
 import re
+import threading
 import time
 
 from bleak import discover, BleakClient
@@ -62,6 +63,10 @@ class BluetoothLowEnergyInterface:
 
         self._debug = debug
 
+        self._connected = False
+
+        self._lock = threading.Lock()
+
         self.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
 
@@ -114,6 +119,8 @@ class BluetoothLowEnergyInterface:
     def connect(self):
         """ Connect to the Bluetooth Extender Box """
         async def start_connection():
+            # `bleak` tells us when the link drops, so the link state never has to be queried
+            self.client.set_disconnected_callback(self._on_disconnect)
             connection = await self.client.connect()
 
             services = await self.client.get_services()
@@ -124,6 +131,7 @@ class BluetoothLowEnergyInterface:
             return connection
 
         self.connection = self._run_and_get(start_connection())
+        self._connected = bool(self.connection)
 
     def disconnect(self):
         """ Disconnect from the Bluetooth Extender Box """
@@ -141,11 +149,16 @@ class BluetoothLowEnergyInterface:
                 pass
 
         self._run_and_get(async_disconnect())
+        self._connected = False
+
+    def _on_disconnect(self, *args):
+        """ Called by `bleak` when the link to the Bluetooth Extender Box drops. """
+        self._connected = False
 
     @property
     def is_connected(self):
         """ Whether this class is connected to the Bluetooth Extender Box """
-        return self.connection
+        return self._connected
 
     def send(self, msg, disable_debug=False, terminator=None, wait=True, wait_idle=True):
         """
@@ -171,44 +184,55 @@ class BluetoothLowEnergyInterface:
              If `wait` is `False`, then return whether sending the message succeeded.
 
         """
+        with self._lock:
+            return self._send(msg, disable_debug=disable_debug, wait=wait, wait_idle=wait_idle)
+
+    def _send(self, msg, disable_debug, wait, wait_idle):
+        """ Implementation of `BluetoothLowEnergyInterface.send`, called while holding the exchange lock. """
         self.feedback = []
         self.ok_counter = 0
         self.disable_debug = disable_debug
 
-        reset_strings = ['Using reset pos!']
-
-        def matches_eol_strings(terms, s):
-            for eol in terms:
-                if s.endswith(eol):
-                    return True
-            return False
+        reset_strings = ('Using reset pos!',)
 
         def notification_handler(sender, data):
             data = data.decode()
 
+            # `self.feedback` may be swapped out between notifications, so only cache it per call
+            feedback = self.feedback
+            append = feedback.append
+            show_debug = self._debug and not self.disable_debug
+
+            last = feedback[-1] if feedback else None
+            last_complete = last is None or last.endswith('\r\n')
+
             data_lines = re.findall(r".*[\r\n]{0,1}", data)
             for line in data_lines[:-1]:
-                if self._debug and not self.disable_debug:
+                if show_debug:
                     self.logger.debug(f"[RECV] {repr(line)}")
 
-                if self.feedback and not self.feedback[-1].endswith('\r\n'):
-                    self.feedback[-1] += line
+                if not last_complete:
+                    last += line
+                    feedback[-1] = last
                 else:
-                    if self.feedback:
-                        self.feedback[-1] = self.feedback[-1].strip('\r\n')
+                    if last is not None:
+                        feedback[-1] = last.strip('\r\n')
 
-                    if 'error' in line:
-                        self.logger.error(MirobotError(line.replace('error: ', '')))
+                    # errors and alarms are always reported as the first token of a line
+                    if line.startswith('error'):
+                        self.logger.error(MirobotError(line.replace('error: ', '', 1)))
+                    elif line.startswith('ALARM'):
+                        self.logger.error(MirobotAlarm(line.split('ALARM: ', 1)[-1]))
 
-                    if 'ALARM' in line:
-                        self.logger.error(MirobotAlarm(line.split('ALARM: ', 1)[1]))
-
-                    if matches_eol_strings(reset_strings, line):
+                    if line.endswith(reset_strings):
                         self.logger.error(MirobotReset('Mirobot was unexpectedly reset!'))
 
-                    self.feedback.append(line)
+                    append(line)
+                    last = line
+
+                last_complete = last.endswith('\r\n')
 
-                if self.feedback[-1] == 'ok\r\n':
+                if last == 'ok\r\n':
                     self.ok_counter += 1
 
         async def async_send(msg):
@@ -216,6 +240,16 @@ class BluetoothLowEnergyInterface:
                 for c in self.characteristics:
                     await self.client.write_gatt_char(c, msg)
 
+            async def wait_for_oks():
+                # back off exponentially so short replies are picked up quickly
+                delay = 0.01
+                while self.ok_counter < 2:
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 0.1)
+                    # don't keep polling for an answer that can never arrive
+                    if not self._connected:
+                        self.logger.exception(MirobotError('Bluetooth Extender Box was disconnected!'))
+
             if wait:
                 for c in self.characteristics:
                     await self.client.start_notify(c, notification_handler)
@@ -227,9 +261,7 @@ class BluetoothLowEnergyInterface:
                 self.logger.debug(f"[SENT] {msg}")
 
             if wait:
-                while self.ok_counter < 2:
-                    # print('waiting...', msg, self.ok_counter)
-                    await asyncio.sleep(0.1)
+                await wait_for_oks()
 
                 if wait_idle:
                     # TODO: really wish I could recursively call `send(msg)` here instead of
@@ -241,15 +273,16 @@ class BluetoothLowEnergyInterface:
                         self.feedback = []
                         self.ok_counter = 0
                         await write(b'?\r\n')
-                        while self.ok_counter < 2:
-                            # print('waiting for idle...', msg, self.ok_counter)
-                            await asyncio.sleep(0.1)
+                        await wait_for_oks()
                         self.mirobot._set_status(self.mirobot._parse_status(self.feedback[0]))
 
                     await check_idle()
 
+                    # notifications stay subscribed, so each poll is a single `?` write
+                    delay = 0.01
                     while self.mirobot.status.state != 'Idle':
-                        # print(self.mirobot.status.state)
+                        await asyncio.sleep(delay)
+                        delay = min(delay * 2, 0.1)
                         await check_idle()
 
                     # print('finished idle')
@@ -272,3 +305,29 @@ class BluetoothLowEnergyInterface:
             time.sleep(0.1)
 
         return self.feedback
+
+    def send_batch(self, msgs, disable_debug=False, terminator=None, wait_idle=True):
+        """
+        Send several messages to the Bluetooth Extender Box. The box relays one message at a time, so this sends them one after another and only waits for the Mirobot to be idle after the last one.
+
+        Parameters
+        ----------
+        msgs : Iterable[str]
+            The messages/instructions to send, in order.
+        disable_debug : bool
+             (Default value = False) Whether to disable debug statements on `idle`-state polling.
+        terminator : str
+            (Default value = `None`) Dummy variable for this method. This implementation will always use `\\r\\n` as the line terminator.
+        wait_idle :
+             (Default value = True) Whether to wait for the Mirobot to be in an `Idle` state after the last message before returning.
+
+        Returns
+        -------
+        msg : List[List[str]]
+             The message output of every message, in the order they were sent.
+        """
+        msgs = list(msgs)
+        outputs = [self.send(msg, disable_debug=disable_debug, wait=True, wait_idle=False) for msg in msgs[:-1]]
+        if msgs:
+            outputs.append(self.send(msgs[-1], disable_debug=disable_debug, wait=True, wait_idle=wait_idle))
+        return outputs
@@ -14,6 +14,21 @@ forward_backward_splitter: NamedTuple = namedtuple('forward_backward_splitter',
 rover_splitter: NamedTuple = namedtuple('rover_splitter', ['wheel', 'rotate', 'move'])
 
 
+class _lazy_alias:
+    """ Build an alias tree on first access and store it on the instance, so that later lookups are plain attribute loads and instances that never use the alias never build it. """
+    def __init__(self, build):
+        self.build = build
+        self.name = build.__name__
+        self.__doc__ = build.__doc__
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        value = instance.__dict__[self.name] = self.build(instance)
+        return value
+
+
 class Mirobot(BaseMirobot):
     """ A class for managing and maintaining known Mirobot operations."""
 
@@ -38,33 +53,42 @@ class Mirobot(BaseMirobot):
 
         self._rover = BaseRover(self)
 
-        self.move = dim_splitter(cartesian=cartesian_type_splitter(ptp=self.go_to_cartesian_ptp,
-                                                                   lin=self.go_to_cartesian_lin),
-                                 angle=self.go_to_axis,
-                                 rail=self.go_to_slide_rail)
+    @_lazy_alias
+    def move(self):
         """ The root of the move alias. Uses `go_to_...` methods. Can be used as `mirobot.move.ptp(...)` or `mirobot.move.angle(...)` """
+        return dim_splitter(cartesian=cartesian_type_splitter(ptp=self.go_to_cartesian_ptp,
+                                                              lin=self.go_to_cartesian_lin),
+                            angle=self.go_to_axis,
+                            rail=self.go_to_slide_rail)
 
-        self.increment = dim_splitter(cartesian=cartesian_type_splitter(ptp=self.increment_cartesian_ptp,
-                                                                        lin=self.increment_cartesian_lin),
-                                      angle=self.increment_axis,
-                                      rail=self.increment_slide_rail)
+    @_lazy_alias
+    def increment(self):
         """ The root of the increment alias. Uses `increment_...` methods. Can be used as `mirobot.increment.ptp(...)` or `mirobot.increment.angle(...)` """
-
-        self.wheel = four_way_splitter(upper=left_right_splitter(left=self._rover.move_upper_left,
-                                                                 right=self._rover.move_upper_right),
-                                       lower=left_right_splitter(left=self._rover.move_bottom_left,
-                                                                 right=self._rover.move_bottom_right),
-                                       left=upper_lower_splitter(upper=self._rover.move_upper_left,
-                                                                 lower=self._rover.move_bottom_left),
-                                       right=upper_lower_splitter(upper=self._rover.move_upper_right,
-                                                                  lower=self._rover.move_bottom_right))
-
-        self.rover = rover_splitter(wheel=self.wheel,
-                                    rotate=left_right_splitter(left=self._rover.rotate_left,
-                                                               right=self._rover.rotate_right),
-                                    move=forward_backward_splitter(forward=self._rover.move_forward,
-                                                                   backward=self._rover.move_backward))
+        return dim_splitter(cartesian=cartesian_type_splitter(ptp=self.increment_cartesian_ptp,
+                                                              lin=self.increment_cartesian_lin),
+                            angle=self.increment_axis,
+                            rail=self.increment_slide_rail)
+
+    @_lazy_alias
+    def wheel(self):
+        """ The root of the wheel alias. Uses the wheel methods from `mirobot.base_rover.BaseRover`. Can be used as `mirobot.wheel.upper.left(...)` or `mirobot.wheel.right.lower(...)` """
+        return four_way_splitter(upper=left_right_splitter(left=self._rover.move_upper_left,
+                                                           right=self._rover.move_upper_right),
+                                 lower=left_right_splitter(left=self._rover.move_bottom_left,
+                                                           right=self._rover.move_bottom_right),
+                                 left=upper_lower_splitter(upper=self._rover.move_upper_left,
+                                                           lower=self._rover.move_bottom_left),
+                                 right=upper_lower_splitter(upper=self._rover.move_upper_right,
+                                                            lower=self._rover.move_bottom_right))
+
+    @_lazy_alias
+    def rover(self):
         """ The root of the rover alias. Uses methods from `mirobot.base_rover.BaseRover`. Can be used as `mirobot.rover.wheel.upper.right(...)` or `mirobot.rover.rotate.left(...)` or `mirobot.rover.move.forward(...)`"""
+        return rover_splitter(wheel=self.wheel,
+                              rotate=left_right_splitter(left=self._rover.rotate_left,
+                                                         right=self._rover.rotate_right),
+                              move=forward_backward_splitter(forward=self._rover.move_forward,
+                                                             backward=self._rover.move_backward))
 
     @property
     def state(self):
@@ -101,6 +125,51 @@ class Mirobot(BaseMirobot):
         """ Whether Mirobot is currently in coordinate mode (`False`) or joint-motion mode (`True`) """
         return self.status.motion_mode
 
+    @staticmethod
+    def _expand_cartesian(x, y, z, a, b, c):
+        """
+        Resolve the positional arguments of the cartesian motion commands.
+
+        Parameters
+        ----------
+        x : Union[float, mirobot.mirobot_status.MirobotCartesians]
+            If of type `mirobot.mirobot_status.MirobotCartesians`, its values are used instead of all the other parameters.
+        y, z, a, b, c : float
+            The remaining positional values.
+
+        Returns
+        -------
+        values : Tuple[float]
+            The values in the order `x, y, z, a, b, c`.
+        """
+        if isinstance(x, MirobotCartesians):
+            return x.x, x.y, x.z, x.a, x.b, x.c
+
+        return x, y, z, a, b, c
+
+    @staticmethod
+    def _expand_angles(x, y, z, a, b, c, d):
+        """
+        Resolve the positional arguments of the angular motion commands.
+
+        Parameters
+        ----------
+        x : Union[float, mirobot.mirobot_status.MirobotAngles]
+            If of type `mirobot.mirobot_status.MirobotAngles`, its values are used instead of all the other parameters.
+        y, z, a, b, c, d : float
+            The remaining positional values.
+
+        Returns
+        -------
+        values : Tuple[float]
+            The values in the order `x, y, z, a, b, c, d`.
+        """
+        if isinstance(x, MirobotAngles):
+            # `MirobotAngles` stores its fields in a different order than our signature
+            return x.x, x.y, x.z, x.a, x.b, x.c, x.d
+
+        return x, y, z, a, b, c, d
+
     def go_to_zero(self, speed=None, wait=None):
         """
         Send all axes to their respective zero positions.
@@ -150,13 +219,7 @@ class Mirobot(BaseMirobot):
             If `wait` is `True`, then return a list of strings which contains message output.
             If `wait` is `False`, then return whether sending the message succeeded.
         """
-        if isinstance(x, MirobotCartesians):
-            inputs = x.asdict()
-
-        else:
-            inputs = {'x': x, 'y': y, 'z': z, 'a': a, 'b': b, 'c': c}
-
-        return super().go_to_cartesian_lin(**inputs,
+        return super().go_to_cartesian_lin(*self._expand_cartesian(x, y, z, a, b, c),
                                            speed=speed, wait=wait)
 
     def go_to_cartesian_ptp(self, x=None, y=None, z=None, a=None, b=None, c=None, speed=None, wait=None):
@@ -190,13 +253,7 @@ class Mirobot(BaseMirobot):
             If `wait` is `False`, then return whether sending the message succeeded.
         """
 
-        if isinstance(x, MirobotCartesians):
-            inputs = x.asdict()
-
-        else:
-            inputs = {'x': x, 'y': y, 'z': z, 'a': a, 'b': b, 'c': c}
-
-        return super().go_to_cartesian_ptp(**inputs,
+        return super().go_to_cartesian_ptp(*self._expand_cartesian(x, y, z, a, b, c),
                                            speed=speed, wait=wait)
 
     def go_to_axis(self, x=None, y=None, z=None, a=None, b=None, c=None, d=None, speed=None, wait=None):
@@ -231,13 +288,7 @@ class Mirobot(BaseMirobot):
             If `wait` is `True`, then return a list of strings which contains message output.
             If `wait` is `False`, then return whether sending the message succeeded.
         """
-        if isinstance(x, MirobotAngles):
-            inputs = x.asdict()
-
-        else:
-            inputs = {'x': x, 'y': y, 'z': z, 'a': a, 'b': b, 'c': c, 'd': d}
-
-        return super().go_to_axis(**inputs,
+        return super().go_to_axis(*self._expand_angles(x, y, z, a, b, c, d),
                                   speed=speed, wait=wait)
 
     def increment_cartesian_lin(self, x=None, y=None, z=None, a=None, b=None, c=None, speed=None, wait=None):
@@ -270,13 +321,7 @@ class Mirobot(BaseMirobot):
             If `wait` is `True`, then return a list of strings which contains message output.
             If `wait` is `False`, then return whether sending the message succeeded.
         """
-        if isinstance(x, MirobotCartesians):
-            inputs = x.asdict()
-
-        else:
-            inputs = {'x': x, 'y': y, 'z': z, 'a': a, 'b': b, 'c': c}
-
-        return super().increment_cartesian_lin(**inputs,
+        return super().increment_cartesian_lin(*self._expand_cartesian(x, y, z, a, b, c),
                                                speed=speed, wait=wait)
 
     def increment_cartesian_ptp(self, x=None, y=None, z=None, a=None, b=None, c=None, speed=None, wait=None):
@@ -309,13 +354,7 @@ class Mirobot(BaseMirobot):
             If `wait` is `True`, then return a list of strings which contains message output.
             If `wait` is `False`, then return whether sending the message succeeded.
         """
-        if isinstance(x, MirobotCartesians):
-            inputs = x.asdict()
-
-        else:
-            inputs = {'x': x, 'y': y, 'z': z, 'a': a, 'b': b, 'c': c}
-
-        return super().increment_cartesian_ptp(**inputs,
+        return super().increment_cartesian_ptp(*self._expand_cartesian(x, y, z, a, b, c),
                                                speed=speed, wait=wait)
 
     def increment_axis(self, x=None, y=None, z=None, a=None, b=None, c=None, d=None, speed=None, wait=None):
@@ -350,13 +389,7 @@ class Mirobot(BaseMirobot):
             If `wait` is `True`, then return a list of strings which contains message output.
             If `wait` is `False`, then return whether sending the message succeeded.
         """
-        if isinstance(x, MirobotAngles):
-            inputs = x.asdict()
-
-        else:
-            inputs = {'x': x, 'y': y, 'z': z, 'a': a, 'b': b, 'c': c, 'd': d}
-
-        return super().increment_axis(**inputs,
+        return super().increment_axis(*self._expand_angles(x, y, z, a, b, c, d),
                                       speed=speed, wait=wait)
 
     def increment_slide_rail(self, d, speed=None, wait=None):
@@ -8,7 +8,7 @@ from .exceptions import ExitOnExceptionStreamHandler, SerialDeviceOpenError, Ser
 
 class SerialDevice:
     """ A class for establishing a connection to a serial device. """
-    def __init__(self, portname='', baudrate=0, stopbits=1, exclusive=True, debug=False):
+    def __init__(self, portname='', baudrate=0, stopbits=1, exclusive=True, debug=False, low_latency=False):
         """ Initialization of `SerialDevice` class
 
         Parameters
@@ -23,6 +23,8 @@ class SerialDevice:
              (Default value = `True`) Whether to (try) forcing exclusivity of serial port for this instance. Is only a true toggle on Linux and OSx; Windows always exclusively blocks serial ports. Setting this variable to `False` on Windows will throw an error.
         debug : bool
              (Default value = `False`) Whether to print DEBUG-level information from the runtime of this class. Show more detailed information on screen output.
+        low_latency : bool
+             (Default value = `False`) Whether to put the port into low latency mode after opening it. See `SerialDevice.set_low_latency`.
 
         Returns
         -------
@@ -33,6 +35,7 @@ class SerialDevice:
         self.baudrate = int(baudrate)
         self.stopbits = int(stopbits)
         self.exclusive = exclusive
+        self.low_latency = low_latency
         self._debug = debug
 
         self.logger = logging.getLogger(__name__)
@@ -47,6 +50,7 @@ class SerialDevice:
 
         self.serialport = serial.Serial(exclusive=exclusive)
         self._is_open = False
+        self._rx_buffer = bytearray()
 
     def __del__(self):
         """ Close the serial port when the class is deleted """
@@ -87,12 +91,18 @@ class SerialDevice:
             A single line that is read from the serial port.
 
         """
+        rx_buffer = self._rx_buffer
         while self._is_open:
             try:
-                msg = self.serialport.readline()
-                if msg != b'':
-                    msg = msg.decode().strip()
-                    return msg
+                eol = rx_buffer.find(b'\n')
+                if eol >= 0:
+                    msg = rx_buffer[:eol + 1]
+                    del rx_buffer[:eol + 1]
+                    return msg.decode().strip()
+
+                # grab everything that has already arrived in one read, otherwise block for the next byte
+                n_waiting = self.serialport.in_waiting
+                rx_buffer += self.serialport.read(n_waiting if n_waiting else 1)
 
             except Exception as e:
                 self.logger.exception(SerialDeviceReadError(e))
@@ -110,12 +120,44 @@ class SerialDevice:
 
                 self.serialport.open()
                 self._is_open = True
+                self._rx_buffer.clear()
 
                 self.logger.debug(f"Succeeded in opening serial port {self.portname}")
 
             except Exception as e:
                 self.logger.exception(SerialDeviceOpenError(e))
 
+            if self.low_latency:
+                self.set_low_latency()
+
+    def set_low_latency(self):
+        """
+        Ask the USB-serial driver to pass received bytes on right away. By default, FTDI and similar adapters hold incoming bytes for up to 16ms, which adds that delay to the round trip of every command.
+        First tries the `ASYNC_LOW_LATENCY` serial flag, then falls back to the adapter's `latency_timer` in sysfs. Only supported on Linux; if neither works, a warning is logged and the port is left as is.
+
+        Returns
+        -------
+        result : bool
+            Whether low latency mode could be enabled.
+        """
+        try:
+            self.serialport.set_low_latency_mode(True)
+        except Exception as e:
+            self.logger.debug(f"Could not set ASYNC_LOW_LATENCY on {self.portname}: {e}")
+        else:
+            return True
+
+        # not every usb-serial driver honors the flag, but they do expose their latency timer (in ms)
+        latency_timer = f'/sys/bus/usb-serial/devices/{os.path.basename(self.portname)}/latency_timer'
+        try:
+            with open(latency_timer, 'w') as f:
+                f.write('1')
+        except OSError as e:
+            self.logger.warning(f"Could not enable low latency mode on {self.portname}: {e}")
+            return False
+        else:
+            return True
+
     def close(self):
         """ Close the serial port. """
         if self._is_open:
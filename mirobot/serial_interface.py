@@ -1,18 +1,39 @@
+import collections
+import functools
 import os
+import threading
 import time
 
-import serial.tools.list_ports as lp
-
 from .serial_device import SerialDevice
 from .exceptions import MirobotError, MirobotAlarm, MirobotReset, MirobotAmbiguousPort
 
 os_is_nt = os.name == 'nt'
 os_is_posix = os.name == 'posix'
 
+# (VID, PID) pairs of the USB-serial bridges found on Mirobot controllers: WCH CH340 and FTDI FT232
+_MIROBOT_USB_IDS = ((0x1A86, 0x7523), (0x0403, 0x6001))
+
+# size of the grbl receive buffer on the Mirobot controller, in bytes
+RX_BUFFER_SIZE = 128
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_comports():
+    """ List the serial ports of this machine. This walks sysfs (or SetupAPI on Windows), so the result is cached; see `SerialInterface.rescan_ports`. """
+    # imported here, so users that always pass a portname never load the platform enumeration code
+    import serial.tools.list_ports as lp
+    return tuple(lp.comports())
+
 
 class SerialInterface:
     """ A class for bridging the interface between `mirobot.base_mirobot.BaseMirobot` and `mirobot.serial_device.SerialDevice`"""
-    def __init__(self, mirobot, portname=None, baudrate=None, stopbits=None, exclusive=True, debug=False, logger=None, autofindport=True):
+
+    # terminal phrases of a reply, as tuples so they can be handed straight to `str.endswith`
+    _OK_EOLS = ('ok',)
+    _RESET_STRINGS = ('Using reset pos!',)
+    _RESET_EOLS = _OK_EOLS + _RESET_STRINGS
+
+    def __init__(self, mirobot, portname=None, baudrate=None, stopbits=None, exclusive=True, debug=False, logger=None, autofindport=True, low_latency=False):
         """ Initialization of `SerialInterface` class
 
         Parameters
@@ -33,6 +54,8 @@ class SerialInterface:
              (Default value = None) Logger instance to use for this class. Usually `mirobot.base_mirobot.BaseMirobot.logger`.
         autofindport : bool
              (Default value = True) Whether to automatically search for an available port if `address` parameter is `None`.
+        low_latency : bool
+             (Default value = False) Whether to ask the USB-serial driver to hand over received bytes right away, instead of batching them for up to 16ms. This cuts the round trip of every command that waits for its `ok`. Only supported on Linux.
 
         Returns
         -------
@@ -45,14 +68,12 @@ class SerialInterface:
             self.logger = logger
 
         self._debug = debug
-        serial_device_kwargs = {'debug': debug, 'exclusive': exclusive}
+        serial_device_kwargs = {'debug': debug, 'exclusive': exclusive, 'low_latency': low_latency}
 
         # check if baudrate was passed in args or kwargs, if not use the default value instead
-        if baudrate is None:
-            serial_device_kwargs['baudrate'] = 115200
+        serial_device_kwargs['baudrate'] = 115200 if baudrate is None else baudrate
         # check if stopbits was passed in args or kwargs, if not use the default value instead
-        if stopbits is None:
-            serial_device_kwargs['stopbits'] = 1
+        serial_device_kwargs['stopbits'] = 1 if stopbits is None else stopbits
 
         # if portname was not passed in and autofindport is set to true, autosearch for a serial port
         if autofindport and portname is None:
@@ -62,9 +83,18 @@ class SerialInterface:
             self.logger.info(f"Using Serial Port \"{self.default_portname}\"")
         else:
             self.default_portname = portname
+            if portname is not None:
+                serial_device_kwargs['portname'] = portname
 
         self.serial_device = SerialDevice(**serial_device_kwargs)
 
+        # serializes each write-and-read-back exchange, so that `BaseMirobot.update_status_async` can run on another thread
+        self._lock = threading.Lock()
+
+        # byte sizes of the lines sent with `wait=False` that the Mirobot has not acknowledged yet
+        self._in_flight = collections.deque()
+        self._in_flight_bytes = 0
+
     @property
     def debug(self):
         """ Return the `debug` property of `SerialInterface` """
@@ -111,19 +141,105 @@ class SerialInterface:
             If `wait` is `False`, then return whether sending the message succeeded.
         """
 
-        output = self.serial_device.send(msg, terminator=terminator)
+        with self._lock:
+            if wait:
+                # the replies of earlier `wait=False` sends come first
+                self._retire_in_flight()
+            else:
+                size = len(msg) + len(terminator)
+                self._retire_in_flight(room=size)
+
+            output = self.serial_device.send(msg, terminator=terminator)
 
-        if self._debug and not disable_debug:
-            self.logger.debug(f"[SENT] {msg}")
+            if self._debug and not disable_debug:
+                self.logger.debug(f"[SENT] {msg}")
 
-        if wait:
-            output = self.wait_for_ok(disable_debug=disable_debug)
+            if wait:
+                output = self.wait_for_ok(disable_debug=disable_debug)
+            else:
+                self._in_flight.append(size)
+                self._in_flight_bytes += size
 
-            if wait_idle:
-                self.wait_until_idle()
+        if wait and wait_idle:
+            self.wait_until_idle()
 
         return output
 
+    def send_batch(self, msgs, disable_debug=False, terminator=os.linesep, wait_idle=True):
+        """
+        Send several messages to the Mirobot, keeping its receive buffer filled instead of waiting for an `ok` after every single message.
+        This uses grbl's character counting scheme: as many lines as fit into the controller's `RX_BUFFER_SIZE` byte receive buffer are written in one go, and a line's bytes are only considered freed again once its `ok` has been read.
+
+        Parameters
+        ----------
+        msgs : Iterable[str]
+             The messages or instructions to send to the Mirobot, in order. None of them may contain any newlines.
+        disable_debug : bool
+            (Default value = `False`) Whether to override the class debug setting.
+        terminator : str
+            (Default value = `os.linesep`) The line separator to use when signaling a new line. Usually `'\\r\\n'` for windows and `'\\n'` for modern operating systems.
+        wait_idle : bool
+            (Default value = `True`) Whether to wait for Mirobot to be idle after the last message before returning.
+
+        Returns
+        -------
+        msg : List[List[str]]
+            The message output of every message, in the order they were sent.
+        """
+        outputs = []
+        # byte sizes of the lines the controller has not acknowledged yet
+        in_flight = collections.deque()
+        buffered = 0
+        payload = ''
+
+        with self._lock:
+            self._retire_in_flight()
+
+            for msg in msgs:
+                line = msg + terminator
+                size = len(line)
+
+                # make room in the controller's receive buffer; oldest lines are acknowledged first
+                while in_flight and buffered + size > RX_BUFFER_SIZE:
+                    if payload:
+                        self.serial_device.send(payload, terminator=terminator)
+                        payload = ''
+                    outputs.append(self.wait_for_ok(disable_debug=disable_debug))
+                    buffered -= in_flight.popleft()
+
+                payload += line
+                in_flight.append(size)
+                buffered += size
+
+                if self._debug and not disable_debug:
+                    self.logger.debug(f"[SENT] {msg}")
+
+            if payload:
+                self.serial_device.send(payload, terminator=terminator)
+
+            for _ in in_flight:
+                outputs.append(self.wait_for_ok(disable_debug=disable_debug))
+
+        if wait_idle:
+            self.wait_until_idle()
+
+        return outputs
+
+    def _retire_in_flight(self, room=RX_BUFFER_SIZE):
+        """
+        Read the acknowledgements of earlier `wait=False` sends, oldest first, until `room` bytes are free in the Mirobot's receive buffer. With the default `room`, all of them are read.
+        Errors and alarms in those replies are still reported by `SerialInterface.wait_for_ok`.
+
+        Parameters
+        ----------
+        room : int
+            (Default value = `RX_BUFFER_SIZE`) The number of bytes that need to fit into the receive buffer.
+        """
+        in_flight = self._in_flight
+        while in_flight and self._in_flight_bytes + room > RX_BUFFER_SIZE:
+            self.wait_for_ok(disable_debug=True)
+            self._in_flight_bytes -= in_flight.popleft()
+
     @property
     def is_connected(self):
         """
@@ -136,6 +252,11 @@ class SerialInterface:
         """
         return self.serial_device.is_open
 
+    @staticmethod
+    def rescan_ports():
+        """ Forget the cached list of serial ports, so that the next port search lists them anew. """
+        _cached_comports.cache_clear()
+
     def _find_portname(self):
         """
         Find the port that might potentially be connected to the Mirobot.
@@ -145,24 +266,56 @@ class SerialInterface:
         device_name : str
             The name of the device that is (most-likely) connected to the Mirobot.
         """
-        port_objects = lp.comports()
+        cached = _cached_comports.cache_info().currsize > 0
+        port_objects = _cached_comports()
+        portname = self._first_open_port(port_objects)
+
+        if cached and (portname is None or not any((p.vid, p.pid) in _MIROBOT_USB_IDS for p in port_objects)):
+            # the Mirobot may have been plugged in since the ports were last listed
+            self.rescan_ports()
+            port_objects = _cached_comports()
+            portname = self._first_open_port(port_objects)
+
+        if portname is not None:
+            return portname
 
         if not port_objects:
             self.logger.exception(MirobotAmbiguousPort("No ports found! Make sure your Mirobot is connected and recognized by your operating system."))
-
         else:
-            for p in port_objects:
-                if os_is_posix:
-                    try:
-                        open(p.device)
-                    except Exception:
-                        continue
-                    else:
-                        return p.device
+            self.logger.exception(MirobotAmbiguousPort("No open ports found! Make sure your Mirobot is connected and is not being used by another process."))
+
+    @staticmethod
+    def _first_open_port(port_objects):
+        """
+        Pick the first usable port, preferring the ones that look like a Mirobot.
+
+        Parameters
+        ----------
+        port_objects : Collection[serial.tools.list_ports_common.ListPortInfo]
+            The ports to choose from.
+
+        Returns
+        -------
+        device_name : str or None
+            The name of the chosen device, or `None` if no port can be used.
+        """
+        # try the ports that look like a Mirobot first; fall back to everything else if none do
+        mirobot_ports = [p for p in port_objects if (p.vid, p.pid) in _MIROBOT_USB_IDS]
+        if mirobot_ports:
+            port_objects = mirobot_ports
+
+        for p in port_objects:
+            if os_is_posix:
+                try:
+                    open(p.device).close()
+                except Exception:
+                    continue
                 else:
                     return p.device
+            else:
+                return p.device
 
-            self.logger.exception(MirobotAmbiguousPort("No open ports found! Make sure your Mirobot is connected and is not being used by another process."))
+        return None
 
     def wait_for_ok(self, reset_expected=False, disable_debug=False):
         """
@@ -181,50 +334,43 @@ class SerialInterface:
         output : List[str]
             A list of output strings upto and including the terminal string.
         """
-        output = ['']
-
-        ok_eols = ['ok']
+        output = []
 
-        reset_strings = ['Using reset pos!']
-
-        def matches_eol_strings(terms, s):
-            for eol in terms:
-                if s.endswith(eol):
-                    return True
-            return False
-
-        if reset_expected:
-            eols = ok_eols + reset_strings
-        else:
-            eols = ok_eols
+        reset_strings = self._RESET_STRINGS
+        eols = self._RESET_EOLS if reset_expected else self._OK_EOLS
 
         if os_is_nt and not reset_expected:
             eol_threshold = 2
         else:
             eol_threshold = 1
 
+        # looked up once, this loop runs for every line the Mirobot sends
+        listen = self.serial_device.listen_to_device
+        show_debug = self._debug and not disable_debug
+        check_reset = not reset_expected
+
         eol_counter = 0
         while eol_counter < eol_threshold:
-            msg = self.serial_device.listen_to_device()
+            msg = listen()
 
-            if self._debug and not disable_debug:
+            if show_debug:
                 self.logger.debug(f"[RECV] {msg}")
 
-            if 'error' in msg:
-                self.logger.error(MirobotError(msg.replace('error: ', '')))
-
-            if 'ALARM' in msg:
-                self.logger.error(MirobotAlarm(msg.split('ALARM: ', 1)[1]))
+            # errors and alarms are always reported as the first token of a line
+            if msg.startswith('error'):
+                self.logger.error(MirobotError(msg.replace('error: ', '', 1)))
+            elif msg.startswith('ALARM'):
+                self.logger.error(MirobotAlarm(msg.split('ALARM: ', 1)[-1]))
 
             output.append(msg)
 
-            if not reset_expected and matches_eol_strings(reset_strings, msg):
+            if check_reset and msg.endswith(reset_strings):
                 self.logger.error(MirobotReset('Mirobot was unexpectedly reset!'))
 
-            if matches_eol_strings(eols, output[-1]):
+            if msg.endswith(eols):
                 eol_counter += 1
 
-        return output[1:]  # don't include the dummy empty string at first index
+        return output
 
     def wait_until_idle(self, refresh_rate=0.1):
         """
@@ -259,7 +405,7 @@ class SerialInterface:
         Returns
         -------
         ok_msg : List[str]
-            The output from an initial Mirobot connection.
+            The output from an initial Mirobot connection. Empty if already connected to this port.
         """
         if portname is None:
             if self.default_portname is not None:
@@ -267,9 +413,15 @@ class SerialInterface:
             else:
                 self.logger.exception(ValueError('Portname must be provided! Example: `portname="COM3"`'))
 
+        if self.serial_device.is_open and self.serial_device.portname == portname:
+            # already connected, the startup banner was consumed back then and won't be sent again
+            return []
+
         self.serial_device.portname = portname
 
         self.serial_device.open()
+        self._in_flight.clear()
+        self._in_flight_bytes = 0
 
         return self.wait_for_ok(reset_expected=True)
 